@@ -1,8 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+import errno
 import ipaddress
+import select
 import socket
-from concurrent.futures import ThreadPoolExecutor
+import struct
+import time
+
+_PROBE_TIMEOUT = 0.35
+_PORT_PROTOCOLS = {22: "ssh", 23: "telnet"}
+
+_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK}
+
+
+def _max_inflight() -> int:
+    """Cap concurrent probe sockets well below the process fd limit so a
+    /20 scan cannot exhaust descriptors needed by the rest of the server."""
+    try:
+        import resource
+
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (ImportError, OSError, ValueError):
+        return 256
+    return max(64, min(1024, soft // 4))
+
+
+_MAX_INFLIGHT = _max_inflight()
 
 
 def validate_subnet(value: str) -> ipaddress.IPv4Network:
@@ -17,27 +41,149 @@ def validate_subnet(value: str) -> ipaddress.IPv4Network:
     return network
 
 
-def _is_open(host: str, port: int, timeout: float = 0.35) -> bool:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.settimeout(timeout)
-        return sock.connect_ex((host, port)) == 0
+def _host_addresses(network: ipaddress.IPv4Network) -> list[str]:
+    """Enumerate host addresses as dotted quads over the integer range,
+    skipping the per-host IPv4Address allocation of network.hosts()."""
+    net_int = int(network.network_address)
+    bcast_int = int(network.broadcast_address)
+    if network.prefixlen >= 31:
+        span = range(net_int, bcast_int + 1)
+    else:
+        span = range(net_int + 1, bcast_int)
+    return [socket.inet_ntoa(struct.pack(">I", n)) for n in span]
+
+
+_Pending = dict[int, tuple[socket.socket, tuple[str, int]]]
+
+
+def _reap_events(
+    poller: select.epoll,
+    pending: _Pending,
+    results: dict[tuple[str, int], bool],
+    wait: float,
+) -> bool:
+    """Reap completed probes, waiting up to ``wait``; False on timeout."""
+    events = poller.poll(wait)
+    for fd, _event in events:
+        sock, pair = pending.pop(fd)
+        poller.unregister(fd)
+        results[pair] = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+        sock.close()
+    return bool(events)
+
+
+def _expire_pending(
+    poller: select.epoll,
+    pending: _Pending,
+    results: dict[tuple[str, int], bool],
+) -> None:
+    for fd, (sock, pair) in pending.items():
+        poller.unregister(fd)
+        results.setdefault(pair, False)
+        sock.close()
+    pending.clear()
+
+
+def _probe_batch_epoll(
+    poller: select.epoll,
+    pairs: list[tuple[str, int]],
+    timeout: float,
+    results: dict[tuple[str, int], bool],
+) -> None:
+    pending: _Pending = {}
+    try:
+        for pair in pairs:
+            while True:
+                try:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    break
+                except OSError:
+                    # Out of file descriptors: reap in-flight probes to free
+                    # some instead of aborting the scan.
+                    if not pending:
+                        raise
+                    if not _reap_events(poller, pending, results, timeout):
+                        _expire_pending(poller, pending, results)
+            sock.setblocking(False)
+            rc = sock.connect_ex(pair)
+            if rc == 0:
+                results[pair] = True
+                sock.close()
+            elif rc in _IN_PROGRESS:
+                pending[sock.fileno()] = (sock, pair)
+                poller.register(sock.fileno(), select.EPOLLOUT | select.EPOLLERR | select.EPOLLHUP)
+            else:
+                results[pair] = False
+                sock.close()
+
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            _reap_events(poller, pending, results, remaining)
+    finally:
+        _expire_pending(poller, pending, results)
+
+
+def _probe_pairs_epoll(pairs: list[tuple[str, int]], timeout: float) -> dict[tuple[str, int], bool]:
+    results: dict[tuple[str, int], bool] = {}
+    poller = select.epoll()
+    try:
+        for start in range(0, len(pairs), _MAX_INFLIGHT):
+            _probe_batch_epoll(poller, pairs[start : start + _MAX_INFLIGHT], timeout, results)
+    finally:
+        poller.close()
+    return results
+
+
+async def _probe(host: str, port: int, timeout: float = _PROBE_TIMEOUT) -> bool:
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
+async def _probe_pairs_async(pairs: list[tuple[str, int]], timeout: float) -> dict[tuple[str, int], bool]:
+    limiter = asyncio.Semaphore(_MAX_INFLIGHT)
+
+    async def probe_pair(host: str, port: int) -> tuple[tuple[str, int], bool]:
+        async with limiter:
+            return (host, port), await _probe(host, port, timeout)
+
+    results = await asyncio.gather(*(probe_pair(host, port) for host, port in pairs))
+    return dict(results)
+
+
+def _probe_pairs(pairs: list[tuple[str, int]], timeout: float = _PROBE_TIMEOUT) -> dict[tuple[str, int], bool]:
+    if hasattr(select, "epoll"):
+        return _probe_pairs_epoll(pairs, timeout)
+    return asyncio.run(_probe_pairs_async(pairs, timeout))
 
 
 def scan_network(subnet: str) -> list[dict[str, object]]:
     network = validate_subnet(subnet)
-    hosts = [str(ip) for ip in network.hosts()]
-
-    def scan_host(host: str) -> dict[str, object] | None:
-        ssh_open = _is_open(host, 22)
-        telnet_open = _is_open(host, 23)
-        if not ssh_open and not telnet_open:
-            return None
-        return {
+    hosts = _host_addresses(network)
+    pairs = [(host, port) for host in hosts for port in _PORT_PROTOCOLS]
+    results = _probe_pairs(pairs)
+
+    open_by_host: dict[str, list[int]] = {}
+    for (host, port), is_open in results.items():
+        if is_open:
+            open_by_host.setdefault(host, []).append(port)
+
+    return [
+        {
             "ip": host,
-            "open_ports": [port for port, ok in ((22, ssh_open), (23, telnet_open)) if ok],
-            "protocols": [name for name, ok in (("ssh", ssh_open), ("telnet", telnet_open)) if ok],
+            "open_ports": sorted(ports),
+            "protocols": [_PORT_PROTOCOLS[port] for port in sorted(ports)],
         }
-
-    with ThreadPoolExecutor(max_workers=128) as executor:
-        rows = list(executor.map(scan_host, hosts))
-    return [row for row in rows if row is not None]
+        for host, ports in ((host, open_by_host.get(host)) for host in hosts)
+        if ports
+    ]
@@ -1,33 +1,77 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
 from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
+import orjson
+
+_QUEUE_MAXSIZE = 1024
+
+_last_second = 0
+_last_prefix = ""
+
+
+def _utc_timestamp() -> str:
+    """ISO-8601 UTC timestamp, re-formatting the date/time part at most
+    once per wall-clock second instead of per message."""
+    global _last_second, _last_prefix
+    ns = time.time_ns()
+    second = ns // 1_000_000_000
+    if second != _last_second:
+        _last_prefix = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _last_second = second
+    return f"{_last_prefix}.{(ns % 1_000_000_000) // 1000:06d}+00:00"
+
 
 class LogStream:
     def __init__(self) -> None:
-        self._subscribers: set[asyncio.Queue[dict[str, str]]] = set()
-        self._lock = asyncio.Lock()
+        # Copy-on-write: publish reads the tuple without locking; only
+        # subscribe/unsubscribe take the lock to swap in a new tuple.
+        self._subscribers: tuple[asyncio.Queue[str], ...] = ()
+        self._lock = threading.Lock()
+
+    def _add(self, queue: asyncio.Queue[str]) -> None:
+        with self._lock:
+            self._subscribers = (*self._subscribers, queue)
+
+    def _remove(self, queue: asyncio.Queue[str]) -> None:
+        with self._lock:
+            self._subscribers = tuple(q for q in self._subscribers if q is not queue)
 
-    async def subscribe(self) -> AsyncIterator[dict[str, str]]:
-        queue: asyncio.Queue[dict[str, str]] = asyncio.Queue()
-        async with self._lock:
-            self._subscribers.add(queue)
+    async def subscribe(self) -> AsyncIterator[str]:
+        """Yield log events as preserialized JSON strings."""
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+        self._add(queue)
         try:
             while True:
                 yield await queue.get()
         finally:
-            async with self._lock:
-                self._subscribers.discard(queue)
+            self._remove(queue)
 
     async def publish(self, message: str, level: str = "info") -> None:
-        payload = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "level": level,
-            "message": message,
-        }
-        async with self._lock:
-            subscribers = list(self._subscribers)
-        for queue in subscribers:
-            queue.put_nowait(payload)
+        # Serialize once; every subscriber gets the same string instead of
+        # each WebSocket re-dumping the dict.
+        payload = orjson.dumps(
+            {
+                "timestamp": _utc_timestamp(),
+                "level": level,
+                "message": message,
+            }
+        ).decode()
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                # Slow subscriber: drop its oldest message rather than
+                # blocking the publisher or growing without bound.
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                try:
+                    queue.put_nowait(payload)
+                except asyncio.QueueFull:
+                    pass
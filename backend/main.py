@@ -2,14 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import functools
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Literal
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
+from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from backend.discovery import scan_network, validate_subnet
 from backend.log_stream import LogStream
@@ -18,14 +23,15 @@ from backend.storage import (
     build_backup_path,
     ensure_parent,
     list_backup_files,
+    read_text_mmap,
     resolve_backup_path,
-    write_text,
+    write_text_async,
 )
 
 logger = logging.getLogger("backend")
 logging.basicConfig(level=logging.INFO)
 
-app = FastAPI(title="Config Backup API")
+app = FastAPI(title="Config Backup API", default_response_class=ORJSONResponse)
 log_stream = LogStream()
 
 
@@ -36,33 +42,46 @@ def _cors_origins() -> list[str]:
     return [origin.strip() for origin in raw_origins.split(",") if origin.strip()]
 
 
+# Environment and frontend-dist layout are fixed for the process lifetime;
+# compute them once instead of re-parsing/stat-ing per request.
+_CORS_ORIGINS = _cors_origins()
+_BACKUP_ROOT = Path(os.environ.get("BACKUP_ROOT", "backups"))
+# Bounded executor for device sessions so concurrent API calls cannot
+# spawn unbounded threads and pile up against sshd's MaxStartups limit.
+_NETMIKO_POOL = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("NETMIKO_WORKERS", "8")), thread_name_prefix="netmiko"
+)
+_FRONTEND_DIST = Path(__file__).resolve().parent.parent / "frontend" / "dist"
+_FRONTEND_INDEX = _FRONTEND_DIST / "index.html" if (_FRONTEND_DIST / "index.html").exists() else None
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=_cors_origins(),
+    allow_origins=_CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-_FRONTEND_DIST = Path(__file__).resolve().parent.parent / "frontend" / "dist"
-if _FRONTEND_DIST.exists() and (_FRONTEND_DIST / "assets").exists():
-    app.mount("/assets", StaticFiles(directory=_FRONTEND_DIST / "assets"), name="assets")
 
+# Unknown paths under these prefixes are API typos, not SPA routes; they
+# must 404 instead of serving index.html.
+_RESERVED_PREFIXES = ("api", "health", "ws")
 
-def _cors_origins() -> list[str]:
-    raw_origins = os.environ.get("FRONTEND_ORIGINS", "")
-    if not raw_origins:
-        return ["http://localhost:5173", "http://127.0.0.1:5173"]
-    return [origin.strip() for origin in raw_origins.split(",") if origin.strip()]
 
+class _SPAStaticFiles(StaticFiles):
+    """Serve the frontend dist, falling back to index.html for SPA routes."""
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=_cors_origins(),
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    async def get_response(self, path: str, scope: Any) -> Any:
+        spa_fallback = _FRONTEND_INDEX is not None and not path.startswith(_RESERVED_PREFIXES)
+        try:
+            response = await super().get_response(path, scope)
+        except StarletteHTTPException as exc:
+            if exc.status_code == 404 and spa_fallback:
+                return FileResponse(_FRONTEND_INDEX)
+            raise
+        if response.status_code == 404 and spa_fallback:
+            return FileResponse(_FRONTEND_INDEX)
+        return response
 
 
 class BackupRequest(BaseModel):
@@ -92,29 +111,21 @@ class RestoreRequest(BaseModel):
     backup_file: str = Field(..., min_length=1)
 
 
-def _backup_root() -> Path:
-    return Path(os.environ.get("BACKUP_ROOT", "backups"))
-
-
-def _frontend_index() -> Path | None:
-    index_path = _FRONTEND_DIST / "index.html"
-    if index_path.exists():
-        return index_path
-    return None
-
-
 @app.post("/api/backup-config", response_model=BackupResponse)
 async def backup_config(payload: BackupRequest) -> BackupResponse:
     await log_stream.publish(f"Backup requested for {payload.device_ip} via {payload.protocol}")
 
     try:
-        running_config = await asyncio.to_thread(
-            fetch_running_config,
-            device_ip=payload.device_ip,
-            username=payload.username,
-            password=payload.password,
-            device_type=payload.device_type,
-            protocol=payload.protocol,
+        running_config = await asyncio.get_running_loop().run_in_executor(
+            _NETMIKO_POOL,
+            functools.partial(
+                fetch_running_config,
+                device_ip=payload.device_ip,
+                username=payload.username,
+                password=payload.password,
+                device_type=payload.device_type,
+                protocol=payload.protocol,
+            ),
         )
     except RuntimeError as exc:
         await log_stream.publish(f"Backup failed for {payload.device_ip}: {exc}", level="error")
@@ -122,39 +133,66 @@ async def backup_config(payload: BackupRequest) -> BackupResponse:
 
     timestamp = datetime.date.today().isoformat()
     backup_path = build_backup_path(
-        root=_backup_root(),
+        root=_BACKUP_ROOT,
         device_type=payload.device_type,
         device_ip=payload.device_ip,
         filename=f"running-config_{timestamp}.txt",
     )
     ensure_parent(backup_path)
-    write_text(backup_path, running_config)
+    await write_text_async(backup_path, running_config)
     await log_stream.publish(f"Backup complete for {payload.device_ip}: {backup_path.name}")
 
-    return BackupResponse(status="success", device=payload.device_ip, file=str(backup_path.relative_to(_backup_root())))
+    return BackupResponse(status="success", device=payload.device_ip, file=str(backup_path.relative_to(_BACKUP_ROOT)))
 
 
 @app.get("/api/backups")
 async def backups_list() -> dict[str, Any]:
-    files = list_backup_files(_backup_root())
+    files = list_backup_files(_BACKUP_ROOT)
     return {"files": files}
 
 
 @app.get("/api/backups/content")
 async def backup_content(path: str = Query(..., min_length=1)) -> dict[str, str]:
     try:
-        target = resolve_backup_path(root=_backup_root(), relative_path=path)
+        target = resolve_backup_path(root=_BACKUP_ROOT, relative_path=path)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     if not target.exists() or not target.is_file():
         raise HTTPException(status_code=404, detail="Backup file not found")
-    return {"path": path, "content": target.read_text()}
+    content = await asyncio.to_thread(target.read_text)
+    return {"path": path, "content": content}
+
+
+@app.get("/api/backups/download")
+async def backup_download(path: str = Query(..., min_length=1)) -> FileResponse:
+    try:
+        target = resolve_backup_path(root=_BACKUP_ROOT, relative_path=path)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if not target.exists() or not target.is_file():
+        raise HTTPException(status_code=404, detail="Backup file not found")
+    # FileResponse lets the server stream/sendfile from page cache instead
+    # of copying the whole file through a Python str.
+    return FileResponse(target, media_type="text/plain", filename=target.name)
+
+
+@app.post("/api/discover")
+async def discover_switches(payload: DiscoverRequest) -> dict[str, Any]:
+    try:
+        validate_subnet(payload.subnet)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    await log_stream.publish(f"Discovery started for {payload.subnet}")
+    devices = await asyncio.to_thread(scan_network, payload.subnet)
+    await log_stream.publish(f"Discovery finished for {payload.subnet}: {len(devices)} device(s)")
+    return {"devices": devices}
 
 
 @app.post("/api/restore-config")
 async def restore_config(payload: RestoreRequest) -> dict[str, str]:
     try:
-        source = resolve_backup_path(root=_backup_root(), relative_path=payload.backup_file)
+        source = resolve_backup_path(root=_BACKUP_ROOT, relative_path=payload.backup_file)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -164,17 +202,20 @@ async def restore_config(payload: RestoreRequest) -> dict[str, str]:
     await log_stream.publish(
         f"Restore requested for {payload.device_ip} using {payload.backup_file} via {payload.protocol}"
     )
-    config_text = source.read_text()
+    config_text = await asyncio.to_thread(read_text_mmap, source)
 
     try:
-        await asyncio.to_thread(
-            restore_running_config,
-            device_ip=payload.device_ip,
-            username=payload.username,
-            password=payload.password,
-            device_type=payload.device_type,
-            protocol=payload.protocol,
-            config_text=config_text,
+        await asyncio.get_running_loop().run_in_executor(
+            _NETMIKO_POOL,
+            functools.partial(
+                restore_running_config,
+                device_ip=payload.device_ip,
+                username=payload.username,
+                password=payload.password,
+                device_type=payload.device_type,
+                protocol=payload.protocol,
+                config_text=config_text,
+            ),
         )
     except RuntimeError as exc:
         await log_stream.publish(f"Restore failed for {payload.device_ip}: {exc}", level="error")
@@ -189,54 +230,17 @@ async def websocket_logs(websocket: WebSocket) -> None:
     await websocket.accept()
     await websocket.send_json({"timestamp": datetime.datetime.utcnow().isoformat(), "level": "info", "message": "Connected to live logs"})
     try:
-        async for event in log_stream.subscribe():
-            await websocket.send_json(event)
+        async for raw in log_stream.subscribe():
+            await websocket.send_text(raw)
     except WebSocketDisconnect:
         return
 
 
-@app.get("/")
-async def frontend() -> FileResponse:
-    index_path = _frontend_index()
-    if not index_path:
-        raise HTTPException(status_code=404, detail="Frontend build not found")
-    return FileResponse(index_path)
-
-
-@app.get("/{full_path:path}")
-async def frontend_fallback(full_path: str) -> FileResponse:
-    if full_path.startswith("api") or full_path.startswith("health") or full_path.startswith("ws"):
-        raise HTTPException(status_code=404, detail="Not Found")
-    asset_path = _FRONTEND_DIST / full_path
-    if asset_path.exists() and asset_path.is_file():
-        return FileResponse(asset_path)
-    index_path = _frontend_index()
-    if not index_path:
-        raise HTTPException(status_code=404, detail="Frontend build not found")
-    return FileResponse(index_path)
-
-
-@app.get("/")
-async def frontend() -> FileResponse:
-    index_path = _frontend_index()
-    if not index_path:
-        raise HTTPException(status_code=404, detail="Frontend build not found")
-    return FileResponse(index_path)
-
-
-@app.get("/{full_path:path}")
-async def frontend_fallback(full_path: str) -> FileResponse:
-    if full_path.startswith("api") or full_path.startswith("health"):
-        raise HTTPException(status_code=404, detail="Not Found")
-    asset_path = _FRONTEND_DIST / full_path
-    if asset_path.exists() and asset_path.is_file():
-        return FileResponse(asset_path)
-    index_path = _frontend_index()
-    if not index_path:
-        raise HTTPException(status_code=404, detail="Frontend build not found")
-    return FileResponse(index_path)
-
-
 @app.get("/health")
 async def health() -> dict[str, Any]:
     return {"status": "ok", "host": "0.0.0.0"}
+
+
+# Mounted last so /api, /ws, and /health routes above keep precedence.
+if _FRONTEND_DIST.exists():
+    app.mount("/", _SPAStaticFiles(directory=_FRONTEND_DIST, html=True), name="spa")
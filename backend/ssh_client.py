@@ -1,7 +1,27 @@
 from __future__ import annotations
 
+import hashlib
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
 from netmiko import ConnectHandler
 
+# Blank lines and IOS comment lines ("!") are skipped during restore.
+_BLANK_OR_COMMENT = re.compile(r"^\s*(?:!|$)")
+
+# Keep pooled sessions per device below sshd's default MaxSessions=10.
+_MAX_IDLE_PER_DEVICE = 9
+_IDLE_TIMEOUT = 60.0
+
+_PoolKey = tuple[str, str, str, str]
+
+_POOL: dict[_PoolKey, list[tuple[ConnectHandler, float]]] = {}
+_POOL_LOCK = threading.Lock()
+_janitor: threading.Thread | None = None
+
 
 def _effective_device_type(device_type: str, protocol: str) -> str:
     if protocol == "telnet" and not device_type.endswith("_telnet"):
@@ -9,27 +29,110 @@ def _effective_device_type(device_type: str, protocol: str) -> str:
     return device_type
 
 
-def fetch_running_config(
-    *, device_ip: str, username: str, password: str, device_type: str, protocol: str = "ssh"
-) -> str:
-    try:
-        connection = ConnectHandler(
-            device_type=_effective_device_type(device_type, protocol),
-            host=device_ip,
-            username=username,
-            password=password,
-        )
-    except Exception as exc:
-        raise RuntimeError("Unable to connect to device") from exc
+def _checkout(key: _PoolKey) -> ConnectHandler | None:
+    while True:
+        with _POOL_LOCK:
+            entries = _POOL.get(key)
+            if not entries:
+                return None
+            connection, _ = entries.pop()
+        try:
+            if connection.is_alive():
+                return connection
+        except Exception:
+            pass
+        _close_quietly(connection)
+
 
+def _checkin(key: _PoolKey, connection: ConnectHandler) -> None:
+    with _POOL_LOCK:
+        entries = _POOL.setdefault(key, [])
+        if len(entries) < _MAX_IDLE_PER_DEVICE:
+            entries.append((connection, time.monotonic()))
+            return
+    _close_quietly(connection)
+
+
+def _close_quietly(connection: ConnectHandler) -> None:
     try:
-        output = connection.send_command("show running-config")
-    except Exception as exc:
-        raise RuntimeError("Unable to fetch running config") from exc
-    finally:
         connection.disconnect()
+    except Exception:
+        pass
+
 
-    return output
+def _evict_idle() -> None:
+    while True:
+        time.sleep(_IDLE_TIMEOUT / 2)
+        cutoff = time.monotonic() - _IDLE_TIMEOUT
+        stale: list[ConnectHandler] = []
+        with _POOL_LOCK:
+            for key, entries in list(_POOL.items()):
+                fresh = [(conn, used) for conn, used in entries if used >= cutoff]
+                stale.extend(conn for conn, used in entries if used < cutoff)
+                if fresh:
+                    _POOL[key] = fresh
+                else:
+                    del _POOL[key]
+        for connection in stale:
+            _close_quietly(connection)
+
+
+def _ensure_janitor() -> None:
+    global _janitor
+    with _POOL_LOCK:
+        if _janitor is not None:
+            return
+        _janitor = threading.Thread(target=_evict_idle, name="ssh-pool-janitor", daemon=True)
+        _janitor.start()
+
+
+@contextmanager
+def _connection(
+    *, device_ip: str, username: str, password: str, device_type: str, protocol: str
+) -> Iterator[ConnectHandler]:
+    _ensure_janitor()
+    # The password digest is part of the key so a request with different
+    # credentials can never check out someone else's authenticated session.
+    key = (
+        device_ip,
+        username,
+        _effective_device_type(device_type, protocol),
+        hashlib.sha256(password.encode()).hexdigest(),
+    )
+    connection = _checkout(key)
+    if connection is None:
+        try:
+            connection = ConnectHandler(
+                device_type=key[2],
+                host=device_ip,
+                username=username,
+                password=password,
+            )
+        except Exception as exc:
+            raise RuntimeError("Unable to connect to device") from exc
+    try:
+        yield connection
+    except Exception:
+        _close_quietly(connection)
+        raise
+    else:
+        _checkin(key, connection)
+
+
+def fetch_running_config(
+    *, device_ip: str, username: str, password: str, device_type: str, protocol: str = "ssh"
+) -> str:
+    with _connection(
+        device_ip=device_ip,
+        username=username,
+        password=password,
+        device_type=device_type,
+        protocol=protocol,
+    ) as connection:
+        try:
+            return connection.send_command("show running-config")
+        except Exception as exc:
+            raise RuntimeError("Unable to fetch running config") from exc
 
 
 def restore_running_config(
@@ -41,25 +144,19 @@ def restore_running_config(
     config_text: str,
     protocol: str = "ssh",
 ) -> None:
-    try:
-        connection = ConnectHandler(
-            device_type=_effective_device_type(device_type, protocol),
-            host=device_ip,
-            username=username,
-            password=password,
-        )
-    except Exception as exc:
-        raise RuntimeError("Unable to connect to device") from exc
+    lines = [line for line in config_text.splitlines() if not _BLANK_OR_COMMENT.match(line)]
+    if not lines:
+        raise RuntimeError("Backup file has no configuration lines to restore")
 
-    try:
-        lines = [line for line in config_text.splitlines() if line.strip() and not line.strip().startswith("!")]
-        if not lines:
-            raise RuntimeError("Backup file has no configuration lines to restore")
-        connection.send_config_set(lines)
-        connection.save_config()
-    except Exception as exc:
-        if isinstance(exc, RuntimeError):
-            raise
-        raise RuntimeError("Unable to restore running config") from exc
-    finally:
-        connection.disconnect()
+    with _connection(
+        device_ip=device_ip,
+        username=username,
+        password=password,
+        device_type=device_type,
+        protocol=protocol,
+    ) as connection:
+        try:
+            connection.send_config_set(lines)
+            connection.save_config()
+        except Exception as exc:
+            raise RuntimeError("Unable to restore running config") from exc
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import mmap
+import os
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -15,26 +20,61 @@ def write_text(path: Path, content: str) -> None:
     path.write_text(content)
 
 
+async def write_text_async(path: Path, content: str) -> None:
+    """Write in a worker thread so the event loop is not blocked."""
+    await asyncio.to_thread(path.write_text, content)
+
+
+def read_text_mmap(path: Path) -> str:
+    """Read a file by mapping it, so the bytes come straight from the
+    page cache without an intermediate read() buffer."""
+    with open(path, "rb") as handle:
+        # Zero-length files cannot be mapped; decode errors must propagate.
+        if os.fstat(handle.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[:].decode()
+
+
+@lru_cache(maxsize=8)
+def _real_root(root_str: str) -> str:
+    return os.path.realpath(root_str)
+
+
 def resolve_backup_path(*, root: Path, relative_path: str) -> Path:
-    candidate = (root / relative_path).resolve()
-    resolved_root = root.resolve()
-    if resolved_root not in candidate.parents and candidate != resolved_root:
+    resolved_root = _real_root(str(root))
+    candidate = os.path.realpath(os.path.join(resolved_root, relative_path))
+    # Plain string-prefix containment check; candidate.parents would
+    # allocate a Path per ancestor on every call.
+    if candidate != resolved_root and not candidate.startswith(resolved_root + os.sep):
         raise ValueError("Invalid backup path")
-    return candidate
+    return Path(candidate)
+
+
+def _walk_txt_files(root_str: str) -> Iterator[os.DirEntry[str]]:
+    stack = [root_str]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".txt") and entry.is_file(follow_symlinks=False):
+                    yield entry
 
 
 def list_backup_files(root: Path) -> list[dict[str, str]]:
-    if not root.exists():
+    root_str = str(root)
+    if not os.path.isdir(root_str):
         return []
-    items: list[dict[str, str]] = []
-    for path in sorted(root.rglob("*.txt")):
-        if not path.is_file():
-            continue
-        items.append(
-            {
-                "path": str(path.relative_to(root)),
-                "name": path.name,
-                "modified": str(int(path.stat().st_mtime)),
-            }
-        )
+    # DirEntry caches type/stat info from the dirent, so this avoids the
+    # per-entry Path allocation and extra stat() calls of rglob.
+    items = [
+        {
+            "path": os.path.relpath(entry.path, root_str),
+            "name": entry.name,
+            "modified": str(int(entry.stat().st_mtime)),
+        }
+        for entry in _walk_txt_files(root_str)
+    ]
+    items.sort(key=lambda item: item["path"])
     return items
@@ -89,9 +89,10 @@ User=${DEFAULT_USER}
 Group=${DEFAULT_GROUP}
 WorkingDirectory=${APP_DIR}
 EnvironmentFile=-${ENV_FILE}
-ExecStart=${UVICORN_BIN} backend.main:app --host 0.0.0.0 --port 8000
+ExecStart=${UVICORN_BIN} backend.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
 Restart=on-failure
 RestartSec=5
+LimitNOFILE=4096
 
 [Install]
 WantedBy=multi-user.target
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from pathlib import Path
 
-from backend import main
+from backend import main, ssh_client
 from backend.discovery import validate_subnet
 from backend.log_stream import LogStream
 
@@ -21,7 +22,7 @@ def test_health_reports_external_binding() -> None:
 def test_log_stream_publish_subscribe() -> None:
     stream = LogStream()
 
-    async def runner() -> dict[str, str]:
+    async def runner() -> str:
         agen = stream.subscribe()
         task = asyncio.create_task(agen.__anext__())
         await asyncio.sleep(0)
@@ -30,12 +31,12 @@ def test_log_stream_publish_subscribe() -> None:
         await agen.aclose()
         return item
 
-    payload = asyncio.run(runner())
+    payload = json.loads(asyncio.run(runner()))
     assert payload['message'] == 'Discovery started'
 
 
 def test_backup_restore_and_file_access(monkeypatch, tmp_path: Path) -> None:
-    monkeypatch.setenv('BACKUP_ROOT', str(tmp_path))
+    monkeypatch.setattr(main, '_BACKUP_ROOT', tmp_path)
 
     monkeypatch.setattr(main, 'fetch_running_config', lambda **kwargs: 'hostname SW1\ninterface Gi0/1')
     captured: dict[str, str] = {}
@@ -76,6 +77,35 @@ def test_backup_restore_and_file_access(monkeypatch, tmp_path: Path) -> None:
     assert captured['device_ip'] == '10.1.1.1'
 
 
+def test_ssh_pool_not_shared_across_credentials(monkeypatch) -> None:
+    class FakeConnection:
+        def is_alive(self) -> bool:
+            return True
+
+        def disconnect(self) -> None:
+            pass
+
+        def send_command(self, command: str) -> str:
+            return 'hostname SW1'
+
+    opened: list[str] = []
+
+    def fake_connect_handler(**kwargs):
+        opened.append(kwargs['password'])
+        return FakeConnection()
+
+    monkeypatch.setattr(ssh_client, 'ConnectHandler', fake_connect_handler)
+    monkeypatch.setattr(ssh_client, '_POOL', {})
+
+    kwargs = dict(device_ip='10.1.1.1', username='admin', device_type='cisco_ios')
+    ssh_client.fetch_running_config(password='right', **kwargs)
+    ssh_client.fetch_running_config(password='right', **kwargs)
+    assert opened == ['right']  # second call reuses the pooled session
+
+    ssh_client.fetch_running_config(password='wrong', **kwargs)
+    assert opened == ['right', 'wrong']  # different password never hits the pool
+
+
 def test_discovery_endpoint(monkeypatch) -> None:
     monkeypatch.setattr(main, 'scan_network', lambda subnet: [{'ip': '192.168.1.8', 'open_ports': [22], 'protocols': ['ssh']}])
     response = asyncio.run(main.discover_switches(main.DiscoverRequest(subnet='192.168.1.0/24')))